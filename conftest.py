@@ -1,23 +1,22 @@
 import pytest
 import asyncio
-import json
-import yaml
-from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
 from faker import Faker
 from unittest.mock import Mock, MagicMock
 import redis
-import requests
 from src.config import Config
-from src.database import DatabaseManager
 from src.api_client import APIClient
 from src.container_manager import ContainerManager
 
-fake = Faker()
+try:
+    import uvloop
+except ImportError:  # optional; not available on Windows
+    uvloop = None
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create an event loop for the test session, using uvloop when installed."""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
     yield loop
     loop.close()
 
@@ -26,10 +25,15 @@ def config():
     """Global configuration fixture."""
     return Config()
 
+@pytest.fixture(scope="session")
+def fake():
+    """Shared Faker instance for generated test data."""
+    return Faker()
+
 @pytest.fixture
 def mock_redis():
     """Mock Redis client."""
-    mock_client = Mock()
+    mock_client = MagicMock(spec=redis.Redis)
     mock_client.get.return_value = None
     mock_client.set.return_value = True
     mock_client.delete.return_value = 1
@@ -39,7 +43,7 @@ def mock_redis():
 @pytest.fixture
 def mock_database():
     """Mock database connection."""
-    mock_db = Mock()
+    mock_db = MagicMock(spec=["execute", "commit", "rollback", "close"])
     mock_db.execute.return_value = Mock(fetchall=lambda: [])
     mock_db.commit.return_value = None
     return mock_db
@@ -54,33 +58,33 @@ def container_manager():
     """Container manager fixture."""
     return ContainerManager()
 
-@pytest.fixture
-def sample_user_data():
-    """Generate sample user data."""
-    return {
+@pytest.fixture(scope="session")
+def sample_user_data(fake):
+    """Generate sample user data (shared, read-only; copy before changing)."""
+    return MappingProxyType({
         "id": fake.uuid4(),
         "name": fake.name(),
         "email": fake.email(),
         "age": fake.random_int(min=18, max=99),
         "created_at": fake.date_time().isoformat()
-    }
+    })
 
-@pytest.fixture
-def sample_product_data():
-    """Generate sample product data."""
-    return {
+@pytest.fixture(scope="session")
+def sample_product_data(fake):
+    """Generate sample product data (shared, read-only; copy before changing)."""
+    return MappingProxyType({
         "id": fake.uuid4(),
         "name": fake.catch_phrase(),
         "price": fake.pydecimal(left_digits=3, right_digits=2, positive=True),
         "category": fake.word(),
         "description": fake.text(max_nb_chars=200),
         "stock": fake.random_int(min=0, max=1000)
-    }
+    })
 
-@pytest.fixture
-def sample_order_data(sample_user_data, sample_product_data):
-    """Generate sample order data."""
-    return {
+@pytest.fixture(scope="session")
+def sample_order_data(fake, sample_user_data, sample_product_data):
+    """Generate sample order data (shared, read-only; copy before changing)."""
+    return MappingProxyType({
         "id": fake.uuid4(),
         "user_id": sample_user_data["id"],
         "product_id": sample_product_data["id"],
@@ -88,7 +92,46 @@ def sample_order_data(sample_user_data, sample_product_data):
         "total_amount": fake.pydecimal(left_digits=4, right_digits=2, positive=True),
         "status": fake.random_element(elements=("pending", "confirmed", "shipped", "delivered")),
         "created_at": fake.date_time().isoformat()
-    }
+    })
+
+@pytest.fixture(scope="session")
+def user_paths(sample_user_data):
+    """Endpoint paths for the sample user, formatted once per session."""
+    base = f"/users/{sample_user_data['id']}"
+    return SimpleNamespace(
+        item=base,
+        avatar=f"{base}/avatar",
+        roles=f"{base}/roles",
+        export=f"{base}/export",
+        orders=f"{base}/orders",
+        wishlist=f"{base}/wishlist"
+    )
+
+@pytest.fixture(scope="session")
+def product_paths(sample_product_data):
+    """Endpoint paths for the sample product, formatted once per session."""
+    base = f"/products/{sample_product_data['id']}"
+    return SimpleNamespace(
+        item=base,
+        images=f"{base}/images",
+        inventory=f"{base}/inventory",
+        recommendations=f"{base}/recommendations",
+        views=f"{base}/views",
+        by_category=f"/products?category={sample_product_data['category']}",
+        search=f"/products/search?q={sample_product_data['name'][:5]}"
+    )
+
+@pytest.fixture(scope="session")
+def order_paths(sample_order_data):
+    """Endpoint paths for the sample order, formatted once per session."""
+    base = f"/orders/{sample_order_data['id']}"
+    return SimpleNamespace(
+        item=base,
+        cancel=f"{base}/cancel",
+        invoice=f"{base}/invoice",
+        delivery_confirm=f"{base}/delivery-confirm",
+        priority=f"{base}/priority"
+    )
 
 @pytest.fixture
 def test_config():
@@ -115,13 +158,19 @@ def test_config():
 @pytest.fixture
 def mock_kubernetes_client():
     """Mock Kubernetes client."""
-    mock_client = Mock()
+    # Spec'd by name to avoid importing the kubernetes package at collection
+    mock_client = MagicMock(spec=[
+        "list_namespaced_pod",
+        "create_namespaced_pod",
+        "read_namespaced_pod",
+        "delete_namespaced_pod"
+    ])
     mock_client.list_namespaced_pod.return_value = Mock(items=[])
     mock_client.create_namespaced_pod.return_value = Mock(metadata=Mock(name="test-pod"))
     return mock_client
 
 @pytest.fixture
-def docker_container_config():
+def docker_container_config(fake):
     """Docker container configuration."""
     return {
         "image": "nginx:latest",
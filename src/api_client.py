@@ -1,60 +1,153 @@
 """API client for cloud native testing platform."""
 
 import asyncio
+import atexit
+import concurrent.futures
+import threading
 import aiohttp
-import requests
-import json
+import orjson
+import random
 import time
-from typing import Dict, Any, Optional, List, Union
+from collections import Counter, deque
+from functools import lru_cache
+from multidict import CIMultiDict
+from types import MappingProxyType
+from typing import Deque, Dict, Any, Mapping, Optional, List, Union
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 import logging
 
+try:
+    import uvloop
+except ImportError:  # optional; not available on Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Background event loop that owns the shared ClientSession. Every request,
+# sync or async, is executed on this loop so connections are pooled across
+# calls and clients instead of being torn down with a per-call loop.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+# Shared read-only headers for responses that never reached the server
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever,
+                name="api-client-loop",
+                daemon=True
+            )
+            _loop_thread.start()
+            atexit.register(_shutdown_loop)
+        return _loop
+
+
+def _shutdown_loop() -> None:
+    """Close the shared session and stop the background event loop."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            return
+        loop, thread = _loop, _loop_thread
+        _loop = _loop_thread = None
+
+    try:
+        asyncio.run_coroutine_threadsafe(APIClient._close_session(), loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"Failed to close shared API session: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    if not thread.is_alive():
+        loop.close()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class APIResponse:
-    """API response container."""
+    """Immutable API response container."""
     status_code: int
     data: Any
-    headers: Dict[str, str]
+    headers: Mapping[str, str]
     response_time: float
     success: bool
     error: Optional[str] = None
 
 
 class RateLimiter:
-    """Simple rate limiter implementation."""
+    """Token-bucket rate limiter.
+    
+    Allows bursts of up to ``max_requests`` and refills at
+    ``max_requests / time_window`` tokens per second.
+    """
+    
+    __slots__ = ("max_requests", "time_window", "capacity", "rate", "tokens", "last_refill", "_lock")
     
     def __init__(self, max_requests: int, time_window: int):
         """Initialize rate limiter."""
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        self.capacity = max_requests
+        self.rate = max_requests / time_window
+        self.tokens = float(max_requests)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill; caller holds the lock."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
     
     def can_proceed(self) -> bool:
-        """Check if request can proceed."""
-        now = time.time()
-        # Remove old requests outside time window
-        self.requests = [req_time for req_time in self.requests if now - req_time < self.time_window]
-        
-        if len(self.requests) < self.max_requests:
-            self.requests.append(now)
-            return True
-        return False
+        """Check if request can proceed, consuming a token if so."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
     
     def wait_time(self) -> float:
         """Calculate wait time until next request is allowed."""
-        if not self.requests:
-            return 0
-        oldest_request = min(self.requests)
-        return max(0, self.time_window - (time.time() - oldest_request))
+        with self._lock:
+            self._refill()
+            return (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+    
+    def acquire(self, n: int = 1) -> float:
+        """Reserve ``n`` tokens at once and return how long to wait before using them.
+        
+        The bucket may go negative; later callers then wait for the debt to refill.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= n
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+# 4xx responses worth retrying; every 5xx is retried as well
+_RETRYABLE_STATUSES = frozenset({408, 425, 429})
+# Transport failures worth retrying: connection errors and timeouts
+_RETRYABLE_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+
+def _is_retryable_status(status: int) -> bool:
+    """Check if a response status is likely transient."""
+    return status >= 500 or status in _RETRYABLE_STATUSES
 
 
 class APIClient:
     """HTTP API client with retry logic and rate limiting."""
     
+    # Shared across all clients; created lazily on the background loop.
+    _session: Optional[aiohttp.ClientSession] = None
+    
     def __init__(
         self,
         base_url: str,
@@ -69,37 +162,77 @@ class APIClient:
         self.retries = retries
         self.auth_token = auth_token
         self.rate_limiter = RateLimiter(rate_limit, 60)  # rate_limit per minute
-        self.session = None
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        # Per-instance so cached URLs never leak across base URLs
+        self._url_for = lru_cache(maxsize=512)(self._build_url)
         
         # Default headers
-        self.default_headers = {
+        headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
             "User-Agent": "TaaP-Test-Client/1.0"
         }
         
         if auth_token:
-            self.default_headers["Authorization"] = f"Bearer {auth_token}"
+            headers["Authorization"] = f"Bearer {auth_token}"
+        
+        self.default_headers = headers
+        
+        # Canned responses served ahead of the network, oldest first (tests)
+        self._test_responses: Deque[APIResponse] = deque()
+    
+    @property
+    def default_headers(self) -> CIMultiDict:
+        """Headers sent with every request; changes apply to later requests."""
+        return self._headers
+    
+    @default_headers.setter
+    def default_headers(self, headers: Dict[str, str]) -> None:
+        """Replace the default headers."""
+        # Prebuilt once so aiohttp can use it without converting per request
+        self._headers = CIMultiDict(headers)
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout),
-            headers=self.default_headers
-        )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit.
+        
+        The shared session outlives any single client and is closed at exit.
+        """
+    
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Return the shared session; must be called on the background loop."""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=0,
+                    limit_per_host=100,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True
+                )
+            )
+        return cls._session
     
-    def _apply_rate_limit(self) -> None:
-        """Apply rate limiting."""
-        if not self.rate_limiter.can_proceed():
-            wait_time = self.rate_limiter.wait_time()
-            if wait_time > 0:
-                time.sleep(wait_time)
+    @classmethod
+    async def _close_session(cls) -> None:
+        """Close the shared session if it was ever opened."""
+        if cls._session is not None:
+            await cls._session.close()
+            cls._session = None
+    
+    def _build_url(self, endpoint: str) -> str:
+        """Join an endpoint onto the base URL."""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+    
+    async def _apply_rate_limit_async(self) -> None:
+        """Apply rate limiting without blocking the event loop."""
+        wait_time = self.rate_limiter.acquire()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
     
     async def _make_request(
         self,
@@ -107,69 +240,93 @@ class APIClient:
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        rate_limited: bool = True
     ) -> APIResponse:
-        """Make HTTP request with retry logic."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        merged_headers = {**self.default_headers, **(headers or {})}
+        """Make HTTP request with retry logic on the shared session.
+        
+        ``rate_limited=False`` skips the limiter for the first attempt, for
+        callers that already reserved a token (see ``bulk``). Queued
+        ``_test_responses`` are returned first without touching the network.
+        """
+        if self._test_responses:
+            return self._test_responses.popleft()
+        loop = _get_loop()
+        coro = self._send(method, endpoint, data, headers, params, rate_limited=rate_limited)
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        *,
+        rate_limited: bool = True
+    ) -> APIResponse:
+        """Run the request and its retries on the background loop."""
+        url = self._url_for(endpoint)
+        if headers:
+            merged_headers = CIMultiDict(self._headers)
+            merged_headers.update(headers)
+        else:
+            merged_headers = self._headers
+        session = self._get_session()
+        # Serialize once; retries resend the same bytes.
+        body = orjson.dumps(data) if data is not None else None
         
         start_time = time.time()
         last_error = None
         
         for attempt in range(self.retries + 1):
+            final_attempt = attempt == self.retries
             try:
-                self._apply_rate_limit()
+                if rate_limited or attempt:
+                    await self._apply_rate_limit_async()
                 
-                if self.session:
-                    # Async request
-                    async with self.session.request(
-                        method=method,
-                        url=url,
-                        json=data,
-                        headers=merged_headers,
-                        params=params
-                    ) as response:
+                async with session.request(
+                    method=method,
+                    url=url,
+                    data=body,
+                    headers=merged_headers,
+                    params=params,
+                    timeout=self._timeout
+                ) as response:
+                    if final_attempt or not _is_retryable_status(response.status):
                         response_data = await self._parse_response(response)
                         response_time = time.time() - start_time
                         
                         return APIResponse(
                             status_code=response.status,
                             data=response_data,
-                            headers=dict(response.headers),
+                            headers=response.headers,
                             response_time=response_time,
                             success=response.status < 400
                         )
-                else:
-                    # Sync request
-                    response = requests.request(
-                        method=method,
-                        url=url,
-                        json=data,
-                        headers=merged_headers,
-                        params=params,
-                        timeout=self.timeout
-                    )
-                    response_time = time.time() - start_time
-                    
-                    return APIResponse(
-                        status_code=response.status_code,
-                        data=self._parse_sync_response(response),
-                        headers=dict(response.headers),
-                        response_time=response_time,
-                        success=response.status_code < 400
-                    )
+                    last_error = f"HTTP {response.status}"
+                    logger.warning(f"Request attempt {attempt + 1} returned retryable status {response.status}")
                     
+            except _RETRYABLE_ERRORS as e:
+                last_error = str(e) or type(e).__name__
+                logger.warning(f"Request attempt {attempt + 1} failed: {last_error}")
             except Exception as e:
                 last_error = str(e)
-                logger.warning(f"Request attempt {attempt + 1} failed: {e}")
-                if attempt < self.retries:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                logger.error(f"Request failed with non-retryable error: {e}")
+                break
+            
+            if not final_attempt:
+                # Jittered exponential backoff
+                await asyncio.sleep((2 ** attempt) * (0.5 + random.random() * 0.5))
         
         response_time = time.time() - start_time
         return APIResponse(
             status_code=0,
             data=None,
-            headers={},
+            headers=_EMPTY_HEADERS,
             response_time=response_time,
             success=False,
             error=last_error
@@ -179,21 +336,10 @@ class APIClient:
         """Parse aiohttp response."""
         content_type = response.headers.get('Content-Type', '')
         if 'application/json' in content_type:
-            return await response.json()
+            return orjson.loads(await response.read())
         else:
             return await response.text()
     
-    def _parse_sync_response(self, response: requests.Response) -> Any:
-        """Parse requests response."""
-        content_type = response.headers.get('Content-Type', '')
-        if 'application/json' in content_type:
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                return response.text
-        else:
-            return response.text
-    
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> APIResponse:
         """Make GET request."""
         return await self._make_request("GET", endpoint, params=params, headers=headers)
@@ -214,32 +360,91 @@ class APIClient:
         """Make DELETE request."""
         return await self._make_request("DELETE", endpoint, headers=headers)
     
+    async def bulk(self, calls: List[tuple], concurrency: int = 32) -> List[Union[APIResponse, BaseException]]:
+        """Issue many requests concurrently on the shared session.
+        
+        Each call is a tuple of ``_make_request`` arguments, e.g.
+        ``("POST", "/users", payload)``. Rate-limit tokens are reserved up
+        front in chunks no larger than the limiter's burst capacity, and each
+        chunk starts only once its tokens are due. Results come back in call
+        order, with any exception returned in place of its response.
+        """
+        chunk_size = max(1, int(self.rate_limiter.capacity))
+        delays = []
+        for start in range(0, len(calls), chunk_size):
+            size = min(chunk_size, len(calls) - start)
+            delays.extend([self.rate_limiter.acquire(size)] * size)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(call: tuple, delay: float) -> APIResponse:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with semaphore:
+                return await self._make_request(*call, rate_limited=False)
+        
+        runs = (run(call, delay) for call, delay in zip(calls, delays))
+        return await asyncio.gather(*runs, return_exceptions=True)
+    
     # Synchronous methods for compatibility
+    def _run_sync(self, coro) -> APIResponse:
+        """Run a request coroutine on the background loop and wait for it.
+        
+        The wait is bounded by the worst case for every attempt timing out
+        plus the retry backoff; past that the request is cancelled.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+        deadline = self.timeout * (self.retries + 1) + 2 ** self.retries + 5
+        try:
+            return future.result(timeout=deadline)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.error(f"Request did not complete within {deadline}s")
+            return APIResponse(
+                status_code=0,
+                data=None,
+                headers=_EMPTY_HEADERS,
+                response_time=float(deadline),
+                success=False,
+                error="Request timed out"
+            )
+    
     def sync_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> APIResponse:
         """Make synchronous GET request."""
-        return asyncio.run(self._make_request("GET", endpoint, params=params, headers=headers))
+        return self._run_sync(self._make_request("GET", endpoint, params=params, headers=headers))
     
     def sync_post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> APIResponse:
         """Make synchronous POST request."""
-        return asyncio.run(self._make_request("POST", endpoint, data=data, headers=headers))
+        return self._run_sync(self._make_request("POST", endpoint, data=data, headers=headers))
 
 
 class MockAPIServer:
     """Mock API server for testing purposes."""
     
-    def __init__(self, responses: Dict[str, Dict[str, Any]]):
-        """Initialize mock server with predefined responses."""
+    __slots__ = ("responses", "request_log", "record_timestamps", "_counts", "_method_counts")
+    
+    def __init__(self, responses: Dict[str, Dict[str, Any]], record_timestamps: bool = True):
+        """Initialize mock server with predefined responses.
+        
+        Log entries carry a ``time.monotonic_ns()`` timestamp unless
+        ``record_timestamps`` is False.
+        """
         self.responses = responses
         self.request_log = []
+        self.record_timestamps = record_timestamps
+        self._counts: Counter = Counter()  # (METHOD, endpoint) -> hits
+        self._method_counts: Counter = Counter()  # METHOD -> hits
     
     def get_response(self, method: str, endpoint: str) -> Dict[str, Any]:
         """Get mock response for method and endpoint."""
-        key = f"{method.upper()}:{endpoint}"
-        self.request_log.append({
-            "method": method,
-            "endpoint": endpoint,
-            "timestamp": datetime.now()
-        })
+        verb = method.upper()
+        key = f"{verb}:{endpoint}"
+        self._counts[(verb, endpoint)] += 1
+        self._method_counts[verb] += 1
+        entry = {"method": method, "endpoint": endpoint}
+        if self.record_timestamps:
+            entry["timestamp"] = time.monotonic_ns()
+        self.request_log.append(entry)
         
         if key in self.responses:
             return self.responses[key]
@@ -259,16 +464,14 @@ class MockAPIServer:
         """Get count of requests matching criteria."""
         if not method and not endpoint:
             return len(self.request_log)
-        
-        count = 0
-        for request in self.request_log:
-            if method and request["method"].upper() != method.upper():
-                continue
-            if endpoint and request["endpoint"] != endpoint:
-                continue
-            count += 1
-        return count
+        if method and endpoint:
+            return self._counts[(method.upper(), endpoint)]
+        if method:
+            return self._method_counts[method.upper()]
+        return sum(count for (_, logged), count in self._counts.items() if logged == endpoint)
     
     def clear_log(self) -> None:
         """Clear request log."""
-        self.request_log.clear() 
\ No newline at end of file
+        self.request_log.clear()
+        self._counts.clear()
+        self._method_counts.clear() 
\ No newline at end of file
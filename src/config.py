@@ -1,12 +1,110 @@
 """Configuration management for the cloud native testing platform."""
 
+import copy
+import logging
 import os
+import tempfile
+import orjson
 import yaml
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Suffix for the opt-in parsed-config cache written beside a YAML file
+_SIDECAR_SUFFIX = ".cache.json"
+
+
+def _parse_yaml(config_file: str) -> Any:
+    """Parse a YAML file with the fastest available safe loader.
+    
+    The file is read as raw bytes in one call so libyaml handles decoding.
+    """
+    with open(config_file, 'rb') as f:
+        return yaml.load(f.read(), Loader=_SafeLoader)
+
+
+def _parse_yaml_sidecar(config_file: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file through a JSON sidecar shared across processes.
+    
+    The sidecar records the source's modification time and size and is
+    ignored once either changes. It is only written when the parsed data
+    round-trips through JSON unchanged, so YAML-only types are never lost.
+    """
+    sidecar = config_file + _SIDECAR_SUFFIX
+    key = [mtime_ns, size]
+    try:
+        with open(sidecar, 'rb') as f:
+            cached = orjson.loads(f.read())
+        if cached["key"] == key:
+            return cached["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    
+    data = _parse_yaml(config_file)
+    try:
+        blob = orjson.dumps({"key": key, "data": data})
+        if orjson.loads(blob)["data"] == data:
+            _write_atomic(sidecar, blob)
+    except (OSError, TypeError) as e:
+        logger.debug("Not caching parsed %s: %s", config_file, e)
+    return data
+
+
+def _write_atomic(path: str, blob: bytes) -> None:
+    """Write ``blob`` to ``path`` so concurrent readers never see a partial file.
+    
+    The bytes go to a uniquely named file in the same directory, which is
+    then renamed over ``path``; it is removed if anything fails first.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_cached(config_file: str, mtime_ns: int, size: int, sidecar: bool) -> Any:
+    """Parse a YAML file once per (path, modification time, size, sidecar).
+    
+    With ``sidecar`` set the result is also persisted next to the file so
+    other processes can skip parsing.
+    """
+    if sidecar:
+        return _parse_yaml_sidecar(config_file, mtime_ns, size)
+    return _parse_yaml(config_file)
+
+
+def _load_yaml(config_file: str) -> Any:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+    
+    The cache key includes the file size so rewrites landing within the
+    filesystem's timestamp granularity are still picked up. Setting
+    ``TAAP_CONFIG_CACHE=1`` also uses the on-disk sidecar; the flag is read
+    on every call. The result is shared with later calls and must not be
+    mutated; ``Config._update_dataclass`` copies container values it keeps.
+    """
+    try:
+        st = os.stat(config_file)
+    except OSError:
+        # Not statable; let open() raise or read it directly
+        return _parse_yaml(config_file)
+    return _parse_yaml_cached(os.path.abspath(config_file), st.st_mtime_ns, st.st_size,
+                              os.environ.get("TAAP_CONFIG_CACHE") == "1")
+
+
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database configuration settings."""
     host: str = "localhost"
@@ -19,7 +117,7 @@ class DatabaseConfig:
     max_overflow: int = 20
 
 
-@dataclass
+@dataclass(slots=True)
 class RedisConfig:
     """Redis configuration settings."""
     host: str = "localhost"
@@ -30,7 +128,7 @@ class RedisConfig:
     max_connections: int = 50
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """API configuration settings."""
     base_url: str = "http://localhost:8080"
@@ -41,7 +139,11 @@ class APIConfig:
     verify_ssl: bool = True
 
 
-@dataclass
+# Read-only default; each ContainerConfig gets its own mutable copy
+_DEFAULT_RESOURCE_LIMITS = MappingProxyType({"cpu": "500m", "memory": "512Mi"})
+
+
+@dataclass(slots=True)
 class ContainerConfig:
     """Container orchestration configuration."""
     docker_host: str = "unix://var/run/docker.sock"
@@ -49,13 +151,14 @@ class ContainerConfig:
     namespace: str = "default"
     registry_url: str = "docker.io"
     pull_policy: str = "IfNotPresent"
-    resource_limits: Dict[str, str] = field(default_factory=lambda: {
-        "cpu": "500m",
-        "memory": "512Mi"
-    })
+    resource_limits: Dict[str, str] = field(default_factory=_DEFAULT_RESOURCE_LIMITS.copy)
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ContainerConfig":
+        """Copy the config, deep-copying only its mutable ``resource_limits``."""
+        return replace(self, resource_limits=copy.deepcopy(self.resource_limits, memo))
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitoringConfig:
     """Monitoring and observability configuration."""
     prometheus_url: str = "http://localhost:9090"
@@ -66,90 +169,162 @@ class MonitoringConfig:
     tracing_enabled: bool = True
 
 
+def _section_to_dict(section: Any) -> Dict[str, Any]:
+    """Convert a slotted config section to a dict without recursive copying."""
+    return {name: getattr(section, name) for name in section.__slots__}
+
+
+# section -> (section class, ((field, environment variable, type), ...))
+_SCHEMA = {
+    "database": (DatabaseConfig, (
+        ("host", "DB_HOST", str),
+        ("port", "DB_PORT", int),
+        ("name", "DB_NAME", str),
+        ("user", "DB_USER", str),
+        ("password", "DB_PASSWORD", str),
+    )),
+    "redis": (RedisConfig, (
+        ("host", "REDIS_HOST", str),
+        ("port", "REDIS_PORT", int),
+        ("password", "REDIS_PASSWORD", str),
+    )),
+    "api": (APIConfig, (
+        ("base_url", "API_BASE_URL", str),
+        ("auth_token", "API_AUTH_TOKEN", str),
+    )),
+    "container": (ContainerConfig, (
+        ("k8s_config_path", "KUBECONFIG", str),
+        ("namespace", "K8S_NAMESPACE", str),
+    )),
+    "monitoring": (MonitoringConfig, ()),
+}
+
+# section class -> names of its fields, for filtering file values
+_FIELD_NAMES = {
+    section_cls: frozenset(section_cls.__slots__)
+    for section_cls, _ in _SCHEMA.values()
+}
+
+
+def _int_fields(section_cls: type) -> frozenset:
+    """Return the names of ``int`` fields, whose file values are coerced with int()."""
+    return frozenset(f.name for f in fields(section_cls) if f.type is int)
+
+
+# section class -> names of its int fields, e.g. a quoted "8080" port
+_INT_FIELDS = {
+    section_cls: _int_fields(section_cls)
+    for section_cls, _ in _SCHEMA.values()
+}
+
+
+def _valid_port(port: int) -> bool:
+    """Check that a port number is in the usable TCP range."""
+    return 0 < port <= 65535
+
+
+# (value accessor, predicate, error message), checked in order
+_VALIDATORS = (
+    (lambda c: c.database.host, bool, "Database host is required"),
+    (lambda c: c.api.base_url, bool, "API base URL is required"),
+    (lambda c: c.database.port, _valid_port, "Invalid database port"),
+    (lambda c: c.redis.port, _valid_port, "Invalid Redis port"),
+)
+
+
 class Config:
     """Main configuration class for the testing platform."""
     
     def __init__(self, config_file: Optional[str] = None):
-        """Initialize configuration from file or environment variables."""
-        self.database = DatabaseConfig()
-        self.redis = RedisConfig()
-        self.api = APIConfig()
-        self.container = ContainerConfig()
-        self.monitoring = MonitoringConfig()
-        
-        if config_file:
-            self.load_from_file(config_file)
+        """Initialize configuration from file or environment variables.
         
-        self.load_from_env()
+        Each section is built in a single pass: defaults, then file values,
+        then environment overrides.
+        """
+        config_data = self._read_file(config_file) if config_file else {}
+        env_get = os.environ.get
+        for section, (section_cls, env_fields) in _SCHEMA.items():
+            obj = section_cls()
+            if config_data.get(section):
+                self._update_dataclass(obj, config_data[section])
+            self._apply_env(obj, env_fields, env_get)
+            setattr(self, section, obj)
     
-    def load_from_file(self, config_file: str) -> None:
-        """Load configuration from YAML file."""
+    def _read_file(self, config_file: str) -> Dict[str, Any]:
+        """Read a YAML configuration file, returning no sections on error."""
         try:
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
-            
-            if 'database' in config_data:
-                self._update_dataclass(self.database, config_data['database'])
-            if 'redis' in config_data:
-                self._update_dataclass(self.redis, config_data['redis'])
-            if 'api' in config_data:
-                self._update_dataclass(self.api, config_data['api'])
-            if 'container' in config_data:
-                self._update_dataclass(self.container, config_data['container'])
-            if 'monitoring' in config_data:
-                self._update_dataclass(self.monitoring, config_data['monitoring'])
-                
+            return _load_yaml(config_file) or {}
         except FileNotFoundError:
-            print(f"Configuration file {config_file} not found, using defaults")
+            logger.warning("Configuration file %s not found, using defaults", config_file)
         except yaml.YAMLError as e:
-            print(f"Error parsing configuration file: {e}")
+            logger.error("Error parsing configuration file: %s", e)
+        return {}
+    
+    def _apply_env(self, obj: Any, env_fields: tuple, env_get=None) -> None:
+        """Override section fields from environment variables that are set."""
+        env_get = env_get or os.environ.get
+        for name, env_var, cast in env_fields:
+            value = env_get(env_var)
+            if value is not None:
+                setattr(obj, name, cast(value))
+    
+    def load_from_file(self, config_file: str) -> None:
+        """Load configuration from YAML file."""
+        config_data = self._read_file(config_file)
+        for section in _SCHEMA:
+            if config_data.get(section):
+                self._update_dataclass(getattr(self, section), config_data[section])
     
     def load_from_env(self) -> None:
         """Load configuration from environment variables."""
-        # Database configuration
-        self.database.host = os.getenv('DB_HOST', self.database.host)
-        self.database.port = int(os.getenv('DB_PORT', self.database.port))
-        self.database.name = os.getenv('DB_NAME', self.database.name)
-        self.database.user = os.getenv('DB_USER', self.database.user)
-        self.database.password = os.getenv('DB_PASSWORD', self.database.password)
-        
-        # Redis configuration
-        self.redis.host = os.getenv('REDIS_HOST', self.redis.host)
-        self.redis.port = int(os.getenv('REDIS_PORT', self.redis.port))
-        self.redis.password = os.getenv('REDIS_PASSWORD', self.redis.password)
-        
-        # API configuration
-        self.api.base_url = os.getenv('API_BASE_URL', self.api.base_url)
-        self.api.auth_token = os.getenv('API_AUTH_TOKEN', self.api.auth_token)
-        
-        # Container configuration
-        self.container.k8s_config_path = os.getenv('KUBECONFIG', self.container.k8s_config_path)
-        self.container.namespace = os.getenv('K8S_NAMESPACE', self.container.namespace)
+        env_get = os.environ.get
+        for section, (_, env_fields) in _SCHEMA.items():
+            self._apply_env(getattr(self, section), env_fields, env_get)
     
     def _update_dataclass(self, obj: Any, data: Dict[str, Any]) -> None:
-        """Update dataclass fields from dictionary."""
-        for key, value in data.items():
-            if hasattr(obj, key):
-                setattr(obj, key, value)
+        """Update dataclass fields from dictionary.
+        
+        Only declared fields are assigned; unknown keys are ignored, and
+        values for ``int`` fields are converted with int(). File data is
+        shared through the parse cache, so dict and list values are copied
+        rather than aliased.
+        """
+        field_names = _FIELD_NAMES.get(type(obj)) or frozenset(f.name for f in fields(obj))
+        int_fields = _INT_FIELDS.get(type(obj))
+        if int_fields is None:
+            int_fields = _int_fields(type(obj))
+        for key in data.keys() & field_names:
+            value = data[key]
+            if key in int_fields and value is not None:
+                value = int(value)
+            elif isinstance(value, (dict, list)):
+                value = copy.deepcopy(value)
+            setattr(obj, key, value)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary."""
+        """Convert configuration to dictionary.
+        
+        Sections are converted shallowly from their slots. The one mutable
+        field, ``resource_limits``, gets a shallow copy so the snapshot does
+        not alias live configuration.
+        """
+        container = _section_to_dict(self.container)
+        container['resource_limits'] = dict(self.container.resource_limits)
         return {
-            'database': self.database.__dict__,
-            'redis': self.redis.__dict__,
-            'api': self.api.__dict__,
-            'container': self.container.__dict__,
-            'monitoring': self.monitoring.__dict__
+            'database': _section_to_dict(self.database),
+            'redis': _section_to_dict(self.redis),
+            'api': _section_to_dict(self.api),
+            'container': container,
+            'monitoring': _section_to_dict(self.monitoring)
         }
     
+    def to_json(self) -> bytes:
+        """Serialize configuration to UTF-8 encoded JSON."""
+        return orjson.dumps(self.to_dict())
+    
     def validate(self) -> bool:
         """Validate configuration settings."""
-        if not self.database.host:
-            raise ValueError("Database host is required")
-        if not self.api.base_url:
-            raise ValueError("API base URL is required")
-        if self.database.port <= 0 or self.database.port > 65535:
-            raise ValueError("Invalid database port")
-        if self.redis.port <= 0 or self.redis.port > 65535:
-            raise ValueError("Invalid Redis port")
+        for get, is_valid, message in _VALIDATORS:
+            if not is_valid(get(self)):
+                raise ValueError(message)
         return True 
\ No newline at end of file
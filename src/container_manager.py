@@ -1,32 +1,93 @@
 """Container management for cloud native testing platform."""
 
+import codecs
 import docker
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
 import yaml
 import tempfile
 import os
 
 logger = logging.getLogger(__name__)
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+    logger.warning("libyaml not available; Kubernetes manifests will be parsed with the pure-Python loader")
 
-@dataclass
+# Python 3.11+ parses a trailing "Z" and variable-length fractions natively
+_NATIVE_ISO_PARSE = sys.version_info >= (3, 11)
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+@lru_cache(maxsize=4096)
+def _parse_docker_ts(value: str) -> datetime:
+    """Parse a Docker ISO-8601 timestamp.
+    
+    Creation times never change, so repeated listings hit the cache.
+    """
+    if _NATIVE_ISO_PARSE:
+        return datetime.fromisoformat(value)
+    # Older parsers need exactly six fractional digits (Docker sends up to nine)
+    value = _FRACTION.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _ports_from_listing(entries: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Convert list-endpoint port entries to the shape of ``Container.ports``.
+    
+    Every host binding is kept, e.g. ``{"80/tcp": [{"HostIp": "0.0.0.0",
+    "HostPort": "8080"}]}``; exposed but unpublished ports map to ``None``.
+    """
+    ports: Dict[str, Any] = {}
+    for entry in entries or ():
+        key = f"{entry['PrivatePort']}/{entry['Type']}"
+        if "PublicPort" not in entry:
+            ports.setdefault(key, None)
+            continue
+        bindings = ports.get(key) or []
+        bindings.append({"HostIp": entry.get("IP", ""), "HostPort": str(entry["PublicPort"])})
+        ports[key] = bindings
+    return ports
+
+
+def _decode_chunks(chunks: Iterator[bytes]) -> Iterator[str]:
+    """Decode streamed UTF-8 chunks, keeping characters split across chunks intact."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+@dataclass(frozen=True, slots=True)
 class ContainerStatus:
     """Container status information."""
     name: str
     image: str
     status: str
-    ports: Dict[str, int]
+    # Docker's ``Container.ports`` shape: "80/tcp" -> host bindings or None
+    ports: Dict[str, Any]
     created_at: datetime
     running: bool
     exit_code: Optional[int] = None
     logs: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PodStatus:
     """Kubernetes pod status information."""
     name: str
@@ -39,19 +100,81 @@ class PodStatus:
     containers: List[Dict[str, Any]]
 
 
+@dataclass(slots=True)
+class _PodEntry:
+    """Stored state of a simulated Kubernetes pod."""
+    spec: Dict[str, Any]
+    status: str
+    created_at: datetime
+
+
+# Pods whose names start with this are cleaned up as test resources
+_TEST_POD_PREFIX = "test-"
+
+
 class DockerManager:
     """Docker container management."""
     
-    def __init__(self, docker_host: str = "unix://var/run/docker.sock"):
-        """Initialize Docker manager."""
+    def __init__(
+        self,
+        docker_host: str = "unix://var/run/docker.sock",
+        status_ttl: float = 2.0,
+        max_pool_size: int = 64
+    ):
+        """Initialize Docker manager.
+        
+        ``status_ttl`` is how long, in seconds, container state fetched for
+        ``get_container_status`` is reused before it is reloaded.
+        ``max_pool_size`` bounds the keep-alive connections to the daemon;
+        it should cover the parallel cleanup workers.
+        """
         self.docker_host = docker_host
+        self.status_ttl = status_ttl
+        self.max_pool_size = max_pool_size
         self.client = None
         self._containers = {}
+        self._reloaded_at: Dict[str, float] = {}
+        # Populated while the event listener is running
+        self._status_cache: Dict[str, ContainerStatus] = {}
+        self._events = None
+    
+    def _get_or_fetch(self, name: str) -> Any:
+        """Return a known container object, fetching and caching it if needed."""
+        container = self._containers.get(name)
+        if container is None:
+            container = self.client.containers.get(name)
+            self._containers[name] = container
+            # A fresh fetch already carries current attrs
+            self._reloaded_at[name] = time.monotonic()
+        return container
+    
+    def _with_container(self, name: str, action: Callable[[Any], Any]) -> Any:
+        """Run ``action`` on the container, refetching once if the cached handle is stale.
+        
+        A container removed or recreated outside this manager makes its old
+        handle raise ``NotFound``; the name is then looked up again.
+        """
+        cached = name in self._containers
+        try:
+            return action(self._get_or_fetch(name))
+        except docker.errors.NotFound:
+            self._forget(name)
+            if not cached:
+                raise
+        return action(self._get_or_fetch(name))
+    
+    def _forget(self, name: str) -> None:
+        """Drop cached state for a container."""
+        self._containers.pop(name, None)
+        self._reloaded_at.pop(name, None)
     
     def connect(self) -> None:
         """Connect to Docker daemon."""
         try:
-            self.client = docker.DockerClient(base_url=self.docker_host)
+            self.client = docker.DockerClient(
+                base_url=self.docker_host,
+                max_pool_size=self.max_pool_size
+            )
             # Test connection
             self.client.ping()
             logger.info("Docker connection established")
@@ -61,10 +184,81 @@ class DockerManager:
     
     def disconnect(self) -> None:
         """Disconnect from Docker daemon."""
+        self.stop_event_listener()
         if self.client:
             self.client.close()
             logger.info("Docker connection closed")
     
+    def start_event_listener(self) -> None:
+        """Keep container status current from the daemon's event stream.
+        
+        While the listener runs, ``get_container_status`` answers from memory
+        for any container fetched since it was last created or started.
+        """
+        if self._events is not None:
+            return
+        self._events = self.client.events(decode=True, filters={"type": "container"})
+        threading.Thread(
+            target=self._consume_events,
+            args=(self._events,),
+            name="docker-events",
+            daemon=True
+        ).start()
+        logger.info("Docker event listener started")
+    
+    def stop_event_listener(self) -> None:
+        """Stop the event listener and drop the status it was maintaining."""
+        events, self._events = self._events, None
+        if events is not None:
+            events.close()
+            logger.info("Docker event listener stopped")
+        self._status_cache.clear()
+    
+    def _consume_events(self, events: Any) -> None:
+        """Apply container events until the stream closes."""
+        try:
+            for event in events:
+                self._apply_event(event)
+        except Exception as e:
+            logger.warning(f"Docker event stream ended: {e}")
+        finally:
+            # Without a live stream the cached status can no longer be trusted
+            if self._events is events:
+                self._events = None
+                self._status_cache.clear()
+    
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        """Update cached container status from a single Docker event."""
+        action = event.get("status") or event.get("Action")
+        attributes = event.get("Actor", {}).get("Attributes", {})
+        name = attributes.get("name")
+        if not name:
+            return
+        # Any state change makes recently reloaded attrs stale
+        self._reloaded_at.pop(name, None)
+        
+        if action in ("create", "start", "destroy"):
+            # Events carry neither ports nor resolved image tags; refetch on next read
+            self._status_cache.pop(name, None)
+            self._forget(name)
+            return
+        
+        cached = self._status_cache.get(name)
+        if cached is None:
+            return  # Fetched in full on first status request
+        if action == "unpause":
+            self._status_cache[name] = replace(cached, status="running", running=True)
+        elif action == "pause":
+            self._status_cache[name] = replace(cached, status="paused", running=False)
+        elif action == "die":
+            exit_code = attributes.get("exitCode")
+            self._status_cache[name] = replace(
+                cached,
+                status="exited",
+                running=False,
+                exit_code=int(exit_code) if exit_code is not None else None
+            )
+    
     def pull_image(self, image: str, tag: str = "latest") -> bool:
         """Pull Docker image."""
         try:
@@ -84,7 +278,8 @@ class DockerManager:
         environment: Optional[Dict[str, str]] = None,
         volumes: Optional[Dict[str, Dict[str, str]]] = None,
         command: Optional[Union[str, List[str]]] = None,
-        detach: bool = True
+        detach: bool = True,
+        labels: Optional[Dict[str, str]] = None
     ) -> Optional[str]:
         """Create and start a container."""
         try:
@@ -96,6 +291,7 @@ class DockerManager:
                 volumes=volumes or {},
                 command=command,
                 detach=detach,
+                labels=labels or {},
                 remove=False
             )
             
@@ -110,12 +306,8 @@ class DockerManager:
     def stop_container(self, name: str, timeout: int = 10) -> bool:
         """Stop a container."""
         try:
-            if name in self._containers:
-                container = self._containers[name]
-            else:
-                container = self.client.containers.get(name)
-            
-            container.stop(timeout=timeout)
+            self._with_container(name, lambda container: container.stop(timeout=timeout))
+            self._reloaded_at.pop(name, None)
             logger.info(f"Container {name} stopped")
             return True
             
@@ -126,13 +318,8 @@ class DockerManager:
     def remove_container(self, name: str, force: bool = False) -> bool:
         """Remove a container."""
         try:
-            if name in self._containers:
-                container = self._containers[name]
-                del self._containers[name]
-            else:
-                container = self.client.containers.get(name)
-            
-            container.remove(force=force)
+            self._with_container(name, lambda container: container.remove(force=force))
+            self._forget(name)
             logger.info(f"Container {name} removed")
             return True
             
@@ -140,84 +327,123 @@ class DockerManager:
             logger.error(f"Failed to remove container {name}: {e}")
             return False
     
-    def get_container_status(self, name: str) -> Optional[ContainerStatus]:
-        """Get container status."""
-        try:
-            if name in self._containers:
-                container = self._containers[name]
-            else:
-                container = self.client.containers.get(name)
-            
-            container.reload()
-            
+    def get_container_status(self, name: str, max_age_ms: Optional[float] = None) -> Optional[ContainerStatus]:
+        """Get container status.
+        
+        ``max_age_ms`` overrides ``status_ttl`` for this call: cached attrs
+        younger than it are used without a reload round-trip.
+        """
+        max_age = self.status_ttl if max_age_ms is None else max_age_ms / 1000
+        
+        def read_status(container: Any) -> ContainerStatus:
+            # Back-to-back polls reuse recently reloaded state
+            now = time.monotonic()
+            if now - self._reloaded_at.get(name, float("-inf")) >= max_age:
+                container.reload()
+                self._reloaded_at[name] = now
             return ContainerStatus(
                 name=container.name,
                 image=container.image.tags[0] if container.image.tags else "unknown",
                 status=container.status,
                 ports=container.ports,
-                created_at=datetime.fromisoformat(container.attrs['Created'].replace('Z', '+00:00')),
+                created_at=_parse_docker_ts(container.attrs['Created']),
                 running=container.status == 'running',
                 exit_code=container.attrs.get('State', {}).get('ExitCode')
             )
+        
+        try:
+            if self._events is not None:
+                # Single lookup: the listener thread may evict entries at any time
+                status = self._status_cache.get(name)
+                if status is not None:
+                    return status
+            
+            status = self._with_container(name, read_status)
+            if self._events is not None:
+                self._status_cache[name] = status
+            return status
             
         except Exception as e:
             logger.error(f"Failed to get status for container {name}: {e}")
             return None
     
-    def get_container_logs(self, name: str, tail: int = 100) -> Optional[str]:
-        """Get container logs."""
+    def get_container_logs(
+        self,
+        name: str,
+        tail: int = 100,
+        decode: bool = False,
+        stream: bool = False
+    ) -> Optional[Union[bytes, str, Iterator[bytes], Iterator[str]]]:
+        """Get container logs.
+        
+        Returns the raw log bytes by default so callers only pay for decoding
+        what they read. ``decode=True`` returns text; ``stream=True`` returns a
+        generator of chunks for bounded memory with large ``tail`` values.
+        """
         try:
-            if name in self._containers:
-                container = self._containers[name]
-            else:
-                container = self.client.containers.get(name)
-            
-            logs = container.logs(tail=tail, decode=True)
-            return logs
+            logs = self._with_container(name, lambda container: container.logs(tail=tail, stream=stream))
+            if not decode:
+                return logs
+            if stream:
+                return _decode_chunks(logs)
+            return logs.decode("utf-8", errors="replace")
             
         except Exception as e:
             logger.error(f"Failed to get logs for container {name}: {e}")
             return None
     
     def list_containers(self, all_containers: bool = True) -> List[ContainerStatus]:
-        """List all containers."""
+        """List all containers.
+        
+        Uses the low-level list endpoint, which returns plain dicts, so no
+        container models are built and sizes are not computed.
+        """
         try:
-            containers = self.client.containers.list(all=all_containers)
-            status_list = []
-            
-            for container in containers:
-                status = ContainerStatus(
-                    name=container.name,
-                    image=container.image.tags[0] if container.image.tags else "unknown",
-                    status=container.status,
-                    ports=container.ports,
-                    created_at=datetime.fromisoformat(container.attrs['Created'].replace('Z', '+00:00')),
-                    running=container.status == 'running'
+            containers = self.client.api.containers(all=all_containers, size=False)
+            return [
+                ContainerStatus(
+                    name=entry["Names"][0].lstrip("/"),
+                    image=entry["Image"],
+                    status=entry["State"],
+                    ports=_ports_from_listing(entry.get("Ports")),
+                    created_at=datetime.fromtimestamp(entry["Created"], tz=timezone.utc),
+                    running=entry["State"] == "running"
                 )
-                status_list.append(status)
-            
-            return status_list
+                for entry in containers
+            ]
             
         except Exception as e:
             logger.error(f"Failed to list containers: {e}")
             return []
     
-    def cleanup_test_containers(self, prefix: str = "test-") -> int:
-        """Clean up test containers with given prefix."""
-        cleanup_count = 0
+    def _stop_and_remove(self, container: Any) -> bool:
+        """Stop and force-remove a single container."""
         try:
-            containers = self.client.containers.list(all=True)
-            for container in containers:
-                if container.name.startswith(prefix):
-                    try:
-                        container.stop(timeout=5)
-                        container.remove(force=True)
-                        cleanup_count += 1
-                        logger.info(f"Cleaned up container: {container.name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to cleanup container {container.name}: {e}")
+            container.stop(timeout=5)
+            container.remove(force=True)
+            self._forget(container.name)
+            logger.info(f"Cleaned up container: {container.name}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to cleanup container {container.name}: {e}")
+            return False
+    
+    def cleanup_test_containers(self, prefix: str = "test-", max_workers: int = 16) -> int:
+        """Clean up test containers with given prefix.
+        
+        Containers are stopped and removed in parallel, so total time is
+        bounded by the slowest container rather than the sum.
+        """
+        try:
+            # Let the daemon narrow the listing; the name filter is an
+            # unanchored regex, so the prefix is still checked exactly below.
+            containers = self.client.containers.list(all=True, filters={"name": re.escape(prefix)})
+            targets = [container for container in containers if container.name.startswith(prefix)]
+            if not targets:
+                return 0
             
-            return cleanup_count
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as executor:
+                return sum(executor.map(self._stop_and_remove, targets))
             
         except Exception as e:
             logger.error(f"Failed to cleanup test containers: {e}")
@@ -232,7 +458,8 @@ class KubernetesManager:
         self.config_path = config_path or os.path.expanduser("~/.kube/config")
         self.namespace = namespace
         self.client = None
-        self._pods = {}
+        self._pods: Dict[str, _PodEntry] = {}
+        self._test_pod_names: set = set()
     
     def connect(self) -> None:
         """Connect to Kubernetes cluster."""
@@ -251,11 +478,13 @@ class KubernetesManager:
             pod_name = pod_spec.get("metadata", {}).get("name", "unknown")
             
             # Simulate pod creation
-            self._pods[pod_name] = {
-                "spec": pod_spec,
-                "status": "Pending",
-                "created_at": datetime.now()
-            }
+            self._pods[pod_name] = _PodEntry(
+                spec=pod_spec,
+                status="Pending",
+                created_at=datetime.now()
+            )
+            if pod_name.startswith(_TEST_POD_PREFIX):
+                self._test_pod_names.add(pod_name)
             
             logger.info(f"Pod {pod_name} created")
             return pod_name
@@ -267,8 +496,8 @@ class KubernetesManager:
     def delete_pod(self, name: str) -> bool:
         """Delete a Kubernetes pod."""
         try:
-            if name in self._pods:
-                del self._pods[name]
+            self._pods.pop(name, None)
+            self._test_pod_names.discard(name)
             
             logger.info(f"Pod {name} deleted")
             return True
@@ -288,11 +517,11 @@ class KubernetesManager:
             return PodStatus(
                 name=name,
                 namespace=self.namespace,
-                phase=pod_data["status"],
-                ready=pod_data["status"] == "Running",
+                phase=pod_data.status,
+                ready=pod_data.status == "Running",
                 restart_count=0,
                 node_name="test-node",
-                created_at=pod_data["created_at"],
+                created_at=pod_data.created_at,
                 containers=[]
             )
             
@@ -307,21 +536,25 @@ class KubernetesManager:
             status = PodStatus(
                 name=name,
                 namespace=self.namespace,
-                phase=data["status"],
-                ready=data["status"] == "Running",
+                phase=data.status,
+                ready=data.status == "Running",
                 restart_count=0,
                 node_name="test-node",
-                created_at=data["created_at"],
+                created_at=data.created_at,
                 containers=[]
             )
             pod_list.append(status)
         
         return pod_list
     
+    def get_test_pod_names(self) -> List[str]:
+        """Names of pods created with the test prefix."""
+        return list(self._test_pod_names)
+    
     def apply_yaml(self, yaml_content: str) -> bool:
         """Apply Kubernetes YAML configuration."""
         try:
-            resources = yaml.safe_load_all(yaml_content)
+            resources = yaml.load_all(yaml_content, Loader=_SafeLoader)
             for resource in resources:
                 if resource and resource.get("kind") == "Pod":
                     self.create_pod(resource)
@@ -379,10 +612,8 @@ class ContainerManager:
             result["docker_containers"] = self.docker.cleanup_test_containers()
             
             # Clean up test pods
-            pods = self.kubernetes.list_pods()
-            for pod in pods:
-                if pod.name.startswith("test-"):
-                    if self.kubernetes.delete_pod(pod.name):
-                        result["k8s_pods"] += 1
+            for pod_name in self.kubernetes.get_test_pod_names():
+                if self.kubernetes.delete_pod(pod_name):
+                    result["k8s_pods"] += 1
         
         return result 
\ No newline at end of file
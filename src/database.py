@@ -2,27 +2,81 @@
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Union
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import asyncpg
 import pymongo
-from pymongo import MongoClient
+from pymongo import IndexModel, MongoClient
 from dataclasses import dataclass
 from src.config import DatabaseConfig
 
 logger = logging.getLogger(__name__)
 
+# Test schema; orders references users and products
+USERS_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    uuid VARCHAR(36) UNIQUE NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(150) UNIQUE NOT NULL,
+    age INTEGER CHECK (age >= 0 AND age <= 150),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_active BOOLEAN DEFAULT TRUE
+);
+"""
 
-@dataclass
+PRODUCTS_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS products (
+    id SERIAL PRIMARY KEY,
+    uuid VARCHAR(36) UNIQUE NOT NULL,
+    name VARCHAR(200) NOT NULL,
+    category VARCHAR(100),
+    price DECIMAL(10,2) NOT NULL,
+    stock INTEGER DEFAULT 0,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_available BOOLEAN DEFAULT TRUE
+);
+"""
+
+ORDERS_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS orders (
+    id SERIAL PRIMARY KEY,
+    uuid VARCHAR(36) UNIQUE NOT NULL,
+    user_id INTEGER REFERENCES users(id),
+    product_id INTEGER REFERENCES products(id),
+    quantity INTEGER NOT NULL CHECK (quantity > 0),
+    total_amount DECIMAL(12,2) NOT NULL,
+    status VARCHAR(50) DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Whole schema as one multi-statement script, sent in a single round-trip
+SCHEMA_DDL = USERS_TABLE_DDL + PRODUCTS_TABLE_DDL + ORDERS_TABLE_DDL
+
+
+@dataclass(frozen=True, slots=True)
 class QueryResult:
     """Database query result container."""
-    data: List[Dict[str, Any]]
+    data: List[Any]  # asyncpg Records, or dicts when requested
     count: int
     execution_time: float
     success: bool
     error: Optional[str] = None
 
 
+def to_columns(records: List[Any]) -> Dict[str, List[Any]]:
+    """Convert query rows into a ``{column: [values...]}`` layout."""
+    if not records:
+        return {}
+    return {column: [record[column] for record in records] for column in records[0].keys()}
+
+
 class PostgreSQLManager:
     """PostgreSQL database manager."""
     
@@ -42,7 +96,11 @@ class PostgreSQLManager:
                 self._connection_string,
                 min_size=5,
                 max_size=self.config.pool_size,
-                command_timeout=30
+                command_timeout=30,
+                # Each connection keeps parsed plans for parameterized
+                # statements, keyed by SQL text; keep them for its lifetime
+                statement_cache_size=1024,
+                max_cached_statement_lifetime=0
             )
             logger.info("PostgreSQL connection pool established")
         except Exception as e:
@@ -55,14 +113,19 @@ class PostgreSQLManager:
             await self.pool.close()
             logger.info("PostgreSQL connection pool closed")
     
-    async def execute_query(self, query: str, *args) -> QueryResult:
-        """Execute a SELECT query."""
-        start_time = datetime.now()
+    async def execute_query(self, query: str, *args, dict_rows: bool = False) -> QueryResult:
+        """Execute a SELECT query.
+        
+        Rows are returned as asyncpg Records, which support ``row["col"]``
+        access without copying. Pass ``dict_rows=True`` for plain dicts, or
+        see ``to_columns`` for a columnar layout.
+        """
+        start_time = time.perf_counter()
         try:
             async with self.pool.acquire() as conn:
                 result = await conn.fetch(query, *args)
-                data = [dict(row) for row in result]
-                execution_time = (datetime.now() - start_time).total_seconds()
+                data = [dict(row) for row in result] if dict_rows else result
+                execution_time = time.perf_counter() - start_time
                 
                 return QueryResult(
                     data=data,
@@ -71,7 +134,7 @@ class PostgreSQLManager:
                     success=True
                 )
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             logger.error(f"Query execution failed: {e}")
             return QueryResult(
                 data=[],
@@ -91,67 +154,66 @@ class PostgreSQLManager:
             logger.error(f"Command execution failed: {e}")
             return False
     
+    async def execute_many(self, commands: List[Tuple[str, tuple]]) -> bool:
+        """Execute several commands on one connection in a single transaction."""
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    for command, args in commands:
+                        await conn.execute(command, *args)
+                return True
+        except Exception as e:
+            logger.error(f"Batch command execution failed: {e}")
+            return False
+    
+    async def execute_bulk(self, command: str, rows: List[tuple]) -> bool:
+        """Execute one command for many argument tuples (e.g. bulk INSERT)."""
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.executemany(command, rows)
+                return True
+        except Exception as e:
+            logger.error(f"Bulk command execution failed: {e}")
+            return False
+    
     async def create_user_table(self) -> bool:
         """Create users table for testing."""
-        query = """
-        CREATE TABLE IF NOT EXISTS users (
-            id SERIAL PRIMARY KEY,
-            uuid VARCHAR(36) UNIQUE NOT NULL,
-            name VARCHAR(100) NOT NULL,
-            email VARCHAR(150) UNIQUE NOT NULL,
-            age INTEGER CHECK (age >= 0 AND age <= 150),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            is_active BOOLEAN DEFAULT TRUE
-        );
-        """
-        return await self.execute_command(query)
+        return await self.execute_command(USERS_TABLE_DDL)
     
     async def create_product_table(self) -> bool:
         """Create products table for testing."""
-        query = """
-        CREATE TABLE IF NOT EXISTS products (
-            id SERIAL PRIMARY KEY,
-            uuid VARCHAR(36) UNIQUE NOT NULL,
-            name VARCHAR(200) NOT NULL,
-            category VARCHAR(100),
-            price DECIMAL(10,2) NOT NULL,
-            stock INTEGER DEFAULT 0,
-            description TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            is_available BOOLEAN DEFAULT TRUE
-        );
-        """
-        return await self.execute_command(query)
+        return await self.execute_command(PRODUCTS_TABLE_DDL)
     
     async def create_order_table(self) -> bool:
         """Create orders table for testing."""
-        query = """
-        CREATE TABLE IF NOT EXISTS orders (
-            id SERIAL PRIMARY KEY,
-            uuid VARCHAR(36) UNIQUE NOT NULL,
-            user_id INTEGER REFERENCES users(id),
-            product_id INTEGER REFERENCES products(id),
-            quantity INTEGER NOT NULL CHECK (quantity > 0),
-            total_amount DECIMAL(12,2) NOT NULL,
-            status VARCHAR(50) DEFAULT 'pending',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-        return await self.execute_command(query)
+        return await self.execute_command(ORDERS_TABLE_DDL)
+    
+    async def create_all_tables(self) -> bool:
+        """Create all test tables with one connection and one round-trip."""
+        return await self.execute_command(SCHEMA_DDL)
 
 
 class MongoDBManager:
     """MongoDB database manager."""
     
-    def __init__(self, host: str = "localhost", port: int = 27017, database: str = "taap_mongo"):
-        """Initialize MongoDB connection manager."""
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 27017,
+        database: str = "taap_mongo",
+        max_workers: int = 8
+    ):
+        """Initialize MongoDB connection manager.
+        
+        ``max_workers`` bounds the thread pool used by ``run_async``.
+        """
         self.host = host
         self.port = port
         self.database_name = database
         self.client = None
         self.database = None
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def connect(self) -> None:
         """Establish connection to MongoDB."""
@@ -167,10 +229,24 @@ class MongoDBManager:
     
     def disconnect(self) -> None:
         """Close MongoDB connection."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         if self.client:
             self.client.close()
             logger.info("MongoDB connection closed")
     
+    async def run_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking pymongo call on the manager's bounded thread pool.
+        
+        Lets coroutines overlap MongoDB I/O with other work instead of
+        blocking the event loop.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mongodb")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+    
     def insert_document(self, collection: str, document: Dict[str, Any]) -> Optional[str]:
         """Insert a document into collection."""
         try:
@@ -181,15 +257,34 @@ class MongoDBManager:
             logger.error(f"Failed to insert document: {e}")
             return None
     
+    def insert_documents(
+        self,
+        collection: str,
+        documents: List[Dict[str, Any]],
+        bypass_validation: bool = False
+    ) -> List[str]:
+        """Insert many documents in one unordered batch."""
+        try:
+            collection_obj = self.database[collection]
+            result = collection_obj.insert_many(
+                documents,
+                ordered=False,
+                bypass_document_validation=bypass_validation
+            )
+            return [str(inserted_id) for inserted_id in result.inserted_ids]
+        except Exception as e:
+            logger.error(f"Failed to insert documents: {e}")
+            return []
+    
     def find_documents(self, collection: str, query: Dict[str, Any] = None, limit: int = 100) -> List[Dict[str, Any]]:
         """Find documents in collection."""
         try:
             collection_obj = self.database[collection]
-            cursor = collection_obj.find(query or {}).limit(limit)
-            documents = []
-            for doc in cursor:
-                doc['_id'] = str(doc['_id'])  # Convert ObjectId to string
-                documents.append(doc)
+            documents = list(collection_obj.find(query or {}, batch_size=limit).limit(limit))
+            # Only the document's own id is stringified; ObjectId references
+            # such as user_id stay usable in follow-up queries
+            for doc in documents:
+                doc['_id'] = str(doc['_id'])
             return documents
         except Exception as e:
             logger.error(f"Failed to find documents: {e}")
@@ -224,6 +319,22 @@ class MongoDBManager:
         except Exception as e:
             logger.error(f"Failed to create index: {e}")
             return False
+    
+    def create_indexes(self, collection: str, fields: List[Tuple[str, bool]]) -> bool:
+        """Create several ascending indexes on a collection in one call.
+        
+        ``fields`` holds ``(field, unique)`` pairs.
+        """
+        try:
+            collection_obj = self.database[collection]
+            collection_obj.create_indexes([
+                IndexModel([(field, pymongo.ASCENDING)], unique=unique)
+                for field, unique in fields
+            ])
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create indexes: {e}")
+            return False
 
 
 class DatabaseManager:
@@ -235,11 +346,14 @@ class DatabaseManager:
         self.postgres = PostgreSQLManager(config)
         self.mongodb = MongoDBManager()
         self._connected = False
+        self._ready_event: Optional[asyncio.Event] = None
     
     async def connect_all(self) -> None:
-        """Connect to all databases."""
-        await self.postgres.connect()
-        self.mongodb.connect()
+        """Connect to all databases concurrently."""
+        await asyncio.gather(
+            self.postgres.connect(),
+            self.mongodb.run_async(self.mongodb.connect)
+        )
         self._connected = True
         logger.info("All database connections established")
     
@@ -250,21 +364,37 @@ class DatabaseManager:
         self._connected = False
         logger.info("All database connections closed")
     
+    async def _ensure_connected(self) -> None:
+        """Connect once, even when several callers race to initialize."""
+        if self._connected:
+            return
+        if self._ready_event is not None:
+            # Another caller is connecting; wait for its outcome
+            await self._ready_event.wait()
+            if not self._connected:
+                raise ConnectionError("Database connection failed")
+            return
+        
+        self._ready_event = asyncio.Event()
+        try:
+            await self.connect_all()
+        finally:
+            self._ready_event.set()
+            self._ready_event = None
+    
     async def initialize_schema(self) -> bool:
         """Initialize database schema for testing."""
-        if not self._connected:
-            await self.connect_all()
+        await self._ensure_connected()
         
         try:
-            # Create PostgreSQL tables
-            await self.postgres.create_user_table()
-            await self.postgres.create_product_table()
-            await self.postgres.create_order_table()
-            
-            # Create MongoDB indexes
-            self.mongodb.create_index("users", "email", unique=True)
-            self.mongodb.create_index("products", "category")
-            self.mongodb.create_index("orders", "status")
+            # PostgreSQL tables go in one script, in dependency order,
+            # while MongoDB indexes are built concurrently
+            await asyncio.gather(
+                self.postgres.create_all_tables(),
+                self.mongodb.run_async(self.mongodb.create_indexes, "users", [("email", True)]),
+                self.mongodb.run_async(self.mongodb.create_indexes, "products", [("category", False)]),
+                self.mongodb.run_async(self.mongodb.create_indexes, "orders", [("status", False)])
+            )
             
             logger.info("Database schema initialized successfully")
             return True
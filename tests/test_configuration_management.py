@@ -1,11 +1,12 @@
 """Configuration management tests for cloud native testing platform."""
 
 import pytest
+import json
 import os
 import tempfile
 import yaml
 from unittest.mock import Mock, patch, mock_open
-from src.config import Config, DatabaseConfig, RedisConfig, APIConfig, ContainerConfig, MonitoringConfig
+from src.config import _parse_yaml, _parse_yaml_cached, Config, DatabaseConfig, RedisConfig, APIConfig, ContainerConfig, MonitoringConfig
 
 
 class TestConfigurationLoading:
@@ -127,24 +128,40 @@ api:
         assert "monitoring" in config_dict
 
     @pytest.mark.unit
-    def test_config_file_not_found(self):
+    def test_config_to_dict_does_not_alias_resource_limits(self):
+        """Test mutating the dict snapshot leaves the configuration intact."""
+        config = Config()
+        config_dict = config.to_dict()
+        config_dict["container"]["resource_limits"]["cpu"] = "4"
+
+        assert config.container.resource_limits["cpu"] == "500m"
+
+    @pytest.mark.unit
+    def test_config_to_json_round_trip(self):
+        """Test JSON serialization matches the dictionary form."""
+        config = Config()
+        
+        assert json.loads(config.to_json()) == config.to_dict()
+
+    @pytest.mark.unit
+    def test_config_file_not_found(self, caplog):
         """Test handling of missing configuration file."""
         with patch("builtins.open", side_effect=FileNotFoundError):
-            with patch("builtins.print") as mock_print:
+            with caplog.at_level("WARNING", logger="src.config"):
                 config = Config(config_file="nonexistent.yaml")
-                mock_print.assert_called()
+                assert "nonexistent.yaml not found" in caplog.text
                 # Should still have default values
                 assert config.database.host == "localhost"
 
     @pytest.mark.unit
-    def test_config_invalid_yaml(self):
+    def test_config_invalid_yaml(self, caplog):
         """Test handling of invalid YAML content."""
         invalid_yaml = "invalid: yaml: content: [unclosed"
         
         with patch("builtins.open", mock_open(read_data=invalid_yaml)):
-            with patch("builtins.print") as mock_print:
+            with caplog.at_level("ERROR", logger="src.config"):
                 config = Config(config_file="invalid.yaml")
-                mock_print.assert_called()
+                assert "Error parsing configuration file" in caplog.text
                 # Should still have default values
                 assert config.database.host == "localhost"
 
@@ -571,6 +588,23 @@ class TestConfigurationDataClasses:
         assert original_config.resource_limits["cpu"] == "1000m"
         assert copied_config.resource_limits["cpu"] == "2000m"
 
+    @pytest.mark.unit
+    def test_config_deep_copy_nested_limits(self):
+        """Test deep copy also copies values nested inside resource limits."""
+        import copy
+        
+        original_config = ContainerConfig(namespace="staging")
+        original_config.resource_limits["allowed_images"] = ["nginx"]
+        
+        copied_config = copy.deepcopy(original_config)
+        copied_config.resource_limits["allowed_images"].append("redis")
+        
+        assert copied_config == ContainerConfig(
+            namespace="staging",
+            resource_limits={"cpu": "500m", "memory": "512Mi", "allowed_images": ["nginx", "redis"]},
+        )
+        assert original_config.resource_limits["allowed_images"] == ["nginx"]
+
     @pytest.mark.unit
     def test_config_serialization_compatibility(self):
         """Test config serialization compatibility."""
@@ -595,4 +629,130 @@ class TestConfigurationDataClasses:
         deserialized = json.loads(json_str)
         
         assert deserialized["base_url"] == api_config.base_url
-        assert deserialized["timeout"] == api_config.timeout 
\ No newline at end of file
+        assert deserialized["timeout"] == api_config.timeout 
+
+
+class TestConfigurationFileCache:
+    """Test parsed configuration file caching."""
+    
+    @pytest.mark.unit
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Test an unchanged file is reused without sharing mutable state."""
+        config_file = tmp_path / "cached.yaml"
+        config_file.write_text("container:\n  resource_limits:\n    cpu: 250m\n")
+        
+        with patch("src.config._parse_yaml", wraps=_parse_yaml) as mock_parse:
+            first = Config(config_file=str(config_file))
+            first.container.resource_limits["cpu"] = "1"
+            second = Config(config_file=str(config_file))
+        
+        assert mock_parse.call_count == 1
+        assert second.container.resource_limits == {"cpu": "250m"}
+    
+    @pytest.mark.unit
+    def test_rewrite_with_same_mtime_is_reparsed(self, tmp_path):
+        """Test a rewrite is detected by size when the mtime is unchanged."""
+        config_file = tmp_path / "rewritten.yaml"
+        config_file.write_text("api:\n  timeout: 5\n")
+        stamp = os.stat(config_file).st_mtime_ns
+        assert Config(config_file=str(config_file)).api.timeout == 5
+        
+        config_file.write_text("api:\n  timeout: 120\n")
+        os.utime(config_file, ns=(stamp, stamp))
+        
+        assert Config(config_file=str(config_file)).api.timeout == 120
+    
+    @pytest.mark.unit
+    def test_file_values_are_coerced_to_int_fields(self, tmp_path):
+        """Test quoted numbers in the file become ints on int fields."""
+        config_file = tmp_path / "quoted.yaml"
+        config_file.write_text('database:\n  port: "8080"\n  host: "5432"\nredis:\n  port: "6380"\n')
+        config = Config(config_file=str(config_file))
+        
+        assert config.database.port == 8080
+        assert config.redis.port == 6380
+        assert config.database.host == "5432"
+        assert config.validate()
+    
+    @pytest.mark.unit
+    def test_unknown_and_non_field_keys_are_ignored(self, tmp_path):
+        """Test only declared section fields are taken from the file."""
+        config_file = tmp_path / "extra.yaml"
+        config_file.write_text("database:\n  host: db.internal\n  bogus: 1\n  __doc__: x\n")
+        config = Config(config_file=str(config_file))
+        
+        assert config.database.host == "db.internal"
+        assert not hasattr(config.database, "bogus")
+        assert config.database.__doc__ == DatabaseConfig.__doc__
+    
+    @pytest.mark.unit
+    def test_sidecar_cache_skips_parsing_in_new_process(self, tmp_path, monkeypatch):
+        """Test the opt-in JSON sidecar is reused until the file changes."""
+        monkeypatch.setenv("TAAP_CONFIG_CACHE", "1")
+        config_file = tmp_path / "shared.yaml"
+        config_file.write_text("database:\n  host: db-one\n")
+        
+        assert Config(config_file=str(config_file)).database.host == "db-one"
+        assert (tmp_path / "shared.yaml.cache.json").exists()
+        
+        # A fresh process starts with an empty in-memory cache
+        _parse_yaml_cached.cache_clear()
+        with patch("src.config._parse_yaml", wraps=_parse_yaml) as mock_parse:
+            assert Config(config_file=str(config_file)).database.host == "db-one"
+            assert mock_parse.call_count == 0
+            
+            config_file.write_text("database:\n  host: db-two-renamed\n")
+            assert Config(config_file=str(config_file)).database.host == "db-two-renamed"
+            assert mock_parse.call_count == 1
+    
+    @pytest.mark.unit
+    def test_sidecar_cache_disabled_by_default(self, tmp_path, monkeypatch):
+        """Test no sidecar is written unless the cache is enabled."""
+        monkeypatch.delenv("TAAP_CONFIG_CACHE", raising=False)
+        config_file = tmp_path / "plain.yaml"
+        config_file.write_text("api:\n  timeout: 9\n")
+        
+        assert Config(config_file=str(config_file)).api.timeout == 9
+        assert list(tmp_path.iterdir()) == [config_file]
+    
+    @pytest.mark.unit
+    def test_sidecar_cache_follows_env_toggle(self, tmp_path, monkeypatch):
+        """Test enabling the cache after a load still writes the sidecar."""
+        monkeypatch.delenv("TAAP_CONFIG_CACHE", raising=False)
+        config_file = tmp_path / "toggled.yaml"
+        config_file.write_text("api:\n  timeout: 11\n")
+        sidecar = tmp_path / "toggled.yaml.cache.json"
+        
+        assert Config(config_file=str(config_file)).api.timeout == 11
+        assert not sidecar.exists()
+        
+        monkeypatch.setenv("TAAP_CONFIG_CACHE", "1")
+        assert Config(config_file=str(config_file)).api.timeout == 11
+        assert sidecar.exists()
+    
+    @pytest.mark.unit
+    def test_sidecar_write_failure_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """Test a failed sidecar write is ignored and cleans up after itself."""
+        monkeypatch.setenv("TAAP_CONFIG_CACHE", "1")
+        config_file = tmp_path / "failing.yaml"
+        config_file.write_text("api:\n  timeout: 7\n")
+        
+        with patch("src.config.os.replace", side_effect=OSError("read-only")):
+            assert Config(config_file=str(config_file)).api.timeout == 7
+        
+        assert list(tmp_path.iterdir()) == [config_file]
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_update_dataclass_accepts_other_dataclasses(self, slots):
+        """Test file values can be applied to dataclasses outside the schema."""
+        from dataclasses import dataclass
+        
+        @dataclass(slots=slots)
+        class ExtraConfig:
+            enabled: bool = False
+        
+        extra = ExtraConfig()
+        Config()._update_dataclass(extra, {"enabled": True, "unknown": 1})
+        
+        assert extra == ExtraConfig(enabled=True)
@@ -2,9 +2,11 @@
 
 import pytest
 import asyncio
+import threading
 from unittest.mock import Mock, patch, AsyncMock
+from docker.errors import NotFound
 from datetime import datetime, timedelta
-from src.container_manager import ContainerManager, DockerManager, KubernetesManager, ContainerStatus, PodStatus
+from src.container_manager import ContainerManager, DockerManager, KubernetesManager, ContainerStatus, PodStatus, _PodEntry
 
 
 class TestDockerContainerOperations:
@@ -132,29 +134,44 @@ class TestDockerContainerOperations:
         """Test successful container logs retrieval."""
         container_name = "test-container"
         mock_container = Mock()
-        mock_container.logs.return_value = "Container log output"
+        mock_container.logs.return_value = b"Container log output"
         container_manager.docker._containers[container_name] = mock_container
         
         logs = container_manager.docker.get_container_logs(container_name, tail=50)
-        assert logs == "Container log output"
-        mock_container.logs.assert_called_once_with(tail=50, decode=True)
+        assert logs == b"Container log output"
+        mock_container.logs.assert_called_once_with(tail=50, stream=False)
 
     @pytest.mark.container
     def test_list_containers_success(self, container_manager):
         """Test successful container listing."""
-        mock_container = Mock()
-        mock_container.name = "test-container"
-        mock_container.status = "running"
-        mock_container.ports = {}
-        mock_container.image.tags = ["nginx:latest"]
-        mock_container.attrs = {"Created": "2024-01-01T12:00:00.000000000Z"}
+        container_entry = {
+            "Names": ["/test-container"],
+            "Image": "nginx:latest",
+            "State": "running",
+            "Ports": [
+                {"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"},
+                {"IP": "::", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"},
+                {"PrivatePort": 443, "Type": "tcp"}
+            ],
+            "Created": 1704110400
+        }
         
         with patch.object(container_manager.docker, 'client') as mock_client:
-            mock_client.containers.list.return_value = [mock_container]
+            mock_client.api.containers.return_value = [container_entry]
             
             containers = container_manager.docker.list_containers()
             assert len(containers) == 1
             assert containers[0].name == "test-container"
+            # Same shape as Container.ports from get_container_status
+            assert containers[0].ports == {
+                "80/tcp": [
+                    {"HostIp": "0.0.0.0", "HostPort": "8080"},
+                    {"HostIp": "::", "HostPort": "8080"}
+                ],
+                "443/tcp": None
+            }
+            assert containers[0].running is True
+            mock_client.api.containers.assert_called_once_with(all=True, size=False)
 
     @pytest.mark.container
     def test_cleanup_test_containers_success(self, container_manager):
@@ -169,6 +186,7 @@ class TestDockerContainerOperations:
             
             count = container_manager.docker.cleanup_test_containers(prefix="test-")
             assert count == 1
+            mock_client.containers.list.assert_called_once_with(all=True, filters={"name": "test\\-"})
             mock_container1.stop.assert_called_once()
             mock_container1.remove.assert_called_once()
 
@@ -402,12 +420,12 @@ class TestDockerContainerOperations:
         container_name = "test-logs-container"
         mock_container = Mock()
         expected_logs = "2024-01-01T12:00:00.000000000Z INFO: Container started"
-        mock_container.logs.return_value = expected_logs
+        mock_container.logs.return_value = expected_logs.encode()
         container_manager.docker._containers[container_name] = mock_container
         
-        logs = container_manager.docker.get_container_logs(container_name, tail=100)
+        logs = container_manager.docker.get_container_logs(container_name, tail=100, decode=True)
         assert logs == expected_logs
-        mock_container.logs.assert_called_once_with(tail=100, decode=True)
+        mock_container.logs.assert_called_once_with(tail=100, stream=False)
 
     @pytest.mark.container
     def test_container_signal_handling(self, container_manager):
@@ -454,11 +472,11 @@ class TestKubernetesOperations:
     def test_delete_pod_success(self, container_manager):
         """Test successful pod deletion."""
         pod_name = "test-pod"
-        container_manager.kubernetes._pods[pod_name] = {
-            "spec": {},
-            "status": "Running",
-            "created_at": datetime.now()
-        }
+        container_manager.kubernetes._pods[pod_name] = _PodEntry(
+            spec={},
+            status="Running",
+            created_at=datetime.now()
+        )
         
         result = container_manager.kubernetes.delete_pod(pod_name)
         assert result is True
@@ -469,11 +487,11 @@ class TestKubernetesOperations:
         """Test successful pod status retrieval."""
         pod_name = "test-pod"
         created_time = datetime.now()
-        container_manager.kubernetes._pods[pod_name] = {
-            "spec": {},
-            "status": "Running",
-            "created_at": created_time
-        }
+        container_manager.kubernetes._pods[pod_name] = _PodEntry(
+            spec={},
+            status="Running",
+            created_at=created_time
+        )
         
         status = container_manager.kubernetes.get_pod_status(pod_name)
         assert status is not None
@@ -485,8 +503,8 @@ class TestKubernetesOperations:
     def test_list_pods_success(self, container_manager):
         """Test successful pod listing."""
         pod_data = {
-            "test-pod-1": {"status": "Running", "created_at": datetime.now()},
-            "test-pod-2": {"status": "Pending", "created_at": datetime.now()}
+            "test-pod-1": _PodEntry(spec={}, status="Running", created_at=datetime.now()),
+            "test-pod-2": _PodEntry(spec={}, status="Pending", created_at=datetime.now())
         }
         container_manager.kubernetes._pods = pod_data
         
@@ -979,4 +997,246 @@ spec:
         invalid_yaml = "invalid: yaml: content: [unclosed"
         
         result = container_manager.kubernetes.apply_yaml(invalid_yaml)
-        assert result is False 
\ No newline at end of file
+        assert result is False 
+
+
+class TestContainerCleanup:
+    """Test bulk cleanup of test resources."""
+    
+    @pytest.mark.container
+    def test_cleanup_continues_past_failures(self, container_manager):
+        """Test one failing container does not block cleanup of the rest."""
+        containers = []
+        for i in range(4):
+            container = Mock()
+            container.name = f"test-container-{i}"
+            containers.append(container)
+        containers[1].stop.side_effect = Exception("Container busy")
+        
+        with patch.object(container_manager.docker, 'client') as mock_client:
+            mock_client.containers.list.return_value = containers
+            
+            count = container_manager.docker.cleanup_test_containers(prefix="test-")
+            assert count == 3
+            for container in (containers[0], containers[2], containers[3]):
+                container.remove.assert_called_once_with(force=True)
+            containers[1].remove.assert_not_called()
+    
+    @pytest.mark.container
+    def test_cleanup_all_removes_only_test_pods(self, container_manager):
+        """Test combined cleanup deletes tracked test pods only."""
+        kubernetes = container_manager.kubernetes
+        for name in ("test-pod-a", "test-pod-b", "prod-pod"):
+            kubernetes.create_pod({"metadata": {"name": name}})
+        kubernetes.delete_pod("test-pod-b")
+        container_manager._connected = True
+        
+        with patch.object(container_manager.docker, 'cleanup_test_containers', return_value=0):
+            result = container_manager.cleanup_all_test_resources()
+        
+        assert result == {"docker_containers": 0, "k8s_pods": 1}
+        assert list(kubernetes._pods) == ["prod-pod"]
+        assert kubernetes.get_test_pod_names() == []
+
+
+class TestContainerStateCache:
+    """Test caching of Docker container lookups and status."""
+    
+    @pytest.mark.container
+    def test_status_polls_reuse_recent_reload(self, container_manager):
+        """Test back-to-back status polls fetch and reload a container once."""
+        mock_container = Mock()
+        mock_container.name = "test-container"
+        mock_container.status = "running"
+        mock_container.ports = {}
+        mock_container.image.tags = []
+        mock_container.attrs = {"Created": "2024-01-01T12:00:00Z", "State": {"ExitCode": 0}}
+        
+        with patch.object(container_manager.docker, 'client') as mock_client:
+            mock_client.containers.get.return_value = mock_container
+            
+            for _ in range(3):
+                assert container_manager.docker.get_container_status("test-container").running
+            
+            mock_client.containers.get.assert_called_once_with("test-container")
+            # The fetch itself returned current attrs
+            mock_container.reload.assert_not_called()
+            
+            container_manager.docker.stop_container("test-container")
+            container_manager.docker.get_container_status("test-container")
+            mock_container.reload.assert_called_once()
+    
+    @pytest.mark.container
+    def test_stale_handle_is_refetched_once(self, container_manager):
+        """Test a container recreated outside the manager is looked up again."""
+        docker = container_manager.docker
+        stale = Mock()
+        stale.stop.side_effect = NotFound("No such container")
+        docker._containers["test-container"] = stale
+        
+        with patch.object(docker, 'client') as mock_client:
+            fresh = Mock()
+            mock_client.containers.get.return_value = fresh
+            
+            assert docker.stop_container("test-container") is True
+            fresh.stop.assert_called_once_with(timeout=10)
+            assert docker._containers["test-container"] is fresh
+            
+            fresh.stop.side_effect = NotFound("No such container")
+            assert docker.stop_container("test-container") is False
+            assert mock_client.containers.get.call_count == 2
+    
+    @pytest.mark.container
+    def test_status_max_age_per_call(self, container_manager):
+        """Test max_age_ms overrides the TTL and events force a reload."""
+        docker = container_manager.docker
+        mock_container = Mock()
+        mock_container.name = "test-container"
+        mock_container.status = "running"
+        mock_container.ports = {}
+        mock_container.image.tags = []
+        mock_container.attrs = {"Created": "2024-01-01T12:00:00Z", "State": {"ExitCode": 0}}
+        docker._containers["test-container"] = mock_container
+        
+        docker.get_container_status("test-container", max_age_ms=500)
+        docker.get_container_status("test-container", max_age_ms=500)
+        assert mock_container.reload.call_count == 1
+        
+        docker.get_container_status("test-container", max_age_ms=0)
+        assert mock_container.reload.call_count == 2
+        
+        docker._apply_event({"status": "die", "Actor": {"Attributes": {"name": "test-container"}}})
+        docker.get_container_status("test-container", max_age_ms=500)
+        assert mock_container.reload.call_count == 3
+    
+    @pytest.mark.container
+    def test_event_stream_updates_cached_status(self, container_manager):
+        """Test container events keep status current without daemon calls."""
+        docker = container_manager.docker
+        docker._events = Mock()  # listener running
+        actor = {"Attributes": {"name": "test-events", "image": "nginx:latest"}}
+        mock_container = Mock()
+        mock_container.name = "test-events"
+        mock_container.status = "running"
+        mock_container.ports = {"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}]}
+        mock_container.image.tags = ["nginx:latest"]
+        mock_container.attrs = {"Created": "2024-01-01T12:00:00Z", "State": {"ExitCode": 0}}
+        
+        with patch.object(docker, 'client') as mock_client:
+            mock_client.containers.get.return_value = mock_container
+            docker._apply_event({"status": "create", "time": 1704110400, "Actor": actor})
+            docker._apply_event({"status": "start", "Actor": actor})
+            status = docker.get_container_status("test-events")
+            assert status.running is True
+            assert status.ports == {"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}]}
+            
+            die_actor = {"Attributes": {**actor["Attributes"], "exitCode": "137"}}
+            docker._apply_event({"status": "die", "Actor": die_actor})
+            status = docker.get_container_status("test-events")
+            assert status.running is False
+            assert status.exit_code == 137
+            assert status.ports == {"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}]}
+            
+            docker._apply_event({"status": "destroy", "Actor": actor})
+            assert "test-events" not in docker._status_cache
+            # Fetched once after start; later reads came from the event cache
+            mock_client.containers.get.assert_called_once_with("test-events")
+    
+    @pytest.mark.container
+    def test_start_event_refreshes_ports(self, container_manager):
+        """Test a restart drops cached status so new port bindings are read."""
+        docker = container_manager.docker
+        docker._events = Mock()  # listener running
+        actor = {"Attributes": {"name": "test-events", "image": "nginx"}}
+        mock_container = Mock()
+        mock_container.name = "test-events"
+        mock_container.status = "running"
+        mock_container.ports = {"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "32768"}]}
+        mock_container.image.tags = ["nginx:latest"]
+        mock_container.attrs = {"Created": "2024-01-01T12:00:00Z", "State": {"ExitCode": 0}}
+        
+        with patch.object(docker, 'client') as mock_client:
+            mock_client.containers.get.return_value = mock_container
+            assert docker.get_container_status("test-events").ports["80/tcp"][0]["HostPort"] == "32768"
+            
+            mock_container.ports = {"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "32769"}]}
+            docker._apply_event({"status": "start", "Actor": actor})
+            status = docker.get_container_status("test-events")
+        
+        assert status.ports["80/tcp"][0]["HostPort"] == "32769"
+        assert status.image == "nginx:latest"
+    
+    @pytest.mark.container
+    def test_event_stream_end_invalidates_cache(self, container_manager):
+        """Test cached status is dropped once the event stream closes."""
+        docker = container_manager.docker
+        actor = {"Attributes": {"name": "test-events", "image": "nginx:latest"}}
+        
+        with patch.object(docker, 'client') as mock_client:
+            mock_client.events.return_value = iter([{"status": "create", "time": 0, "Actor": actor}])
+            docker.start_event_listener()
+            for thread in threading.enumerate():
+                if thread.name == "docker-events":
+                    thread.join(timeout=5)
+        
+        assert docker._events is None
+        assert docker._status_cache == {}
+    
+    @pytest.mark.container
+    def test_docker_client_uses_large_connection_pool(self):
+        """Test the Docker client keeps enough connections for parallel work."""
+        docker_manager = DockerManager(max_pool_size=32)
+        
+        with patch('src.container_manager.docker.DockerClient') as mock_docker_client:
+            docker_manager.connect()
+        
+        mock_docker_client.assert_called_once_with(base_url=docker_manager.docker_host, max_pool_size=32)
+
+
+class TestContainerLogs:
+    """Test raw, decoded and streamed container log retrieval."""
+    
+    @pytest.mark.container
+    def test_logs_decode_on_request(self, container_manager):
+        """Test logs are returned as bytes unless decoding is requested."""
+        mock_container = Mock()
+        mock_container.logs.return_value = b"INFO: started\n"
+        container_manager.docker._containers["test-logs"] = mock_container
+        
+        assert container_manager.docker.get_container_logs("test-logs") == b"INFO: started\n"
+        assert container_manager.docker.get_container_logs("test-logs", decode=True) == "INFO: started\n"
+    
+    @pytest.mark.container
+    def test_logs_stream_chunks(self, container_manager):
+        """Test streamed logs are yielded chunk by chunk."""
+        mock_container = Mock()
+        mock_container.logs.return_value = iter([b"line 1\n", b"line 2\n"])
+        container_manager.docker._containers["test-logs"] = mock_container
+        
+        chunks = container_manager.docker.get_container_logs("test-logs", tail=1000, decode=True, stream=True)
+        
+        assert list(chunks) == ["line 1\n", "line 2\n"]
+        mock_container.logs.assert_called_once_with(tail=1000, stream=True)
+    
+    @pytest.mark.container
+    def test_logs_stream_keeps_split_multibyte_characters(self, container_manager):
+        """Test a UTF-8 character split across chunks is decoded intact."""
+        encoded = "état ✓\n".encode()
+        mock_container = Mock()
+        mock_container.logs.return_value = iter([encoded[:1], encoded[1:7], encoded[7:]])
+        container_manager.docker._containers["test-logs"] = mock_container
+        
+        chunks = container_manager.docker.get_container_logs("test-logs", decode=True, stream=True)
+        
+        assert "".join(chunks) == "état ✓\n"
+    
+    @pytest.mark.container
+    def test_logs_stream_replaces_truncated_tail(self, container_manager):
+        """Test an incomplete character at the end of the stream is replaced."""
+        mock_container = Mock()
+        mock_container.logs.return_value = iter([b"done ", "✓".encode()[:2]])
+        container_manager.docker._containers["test-logs"] = mock_container
+        
+        chunks = container_manager.docker.get_container_logs("test-logs", decode=True, stream=True)
+        
+        assert list(chunks) == ["done ", "�"]
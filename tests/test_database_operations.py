@@ -2,9 +2,14 @@
 
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock
+import threading
+import bson
+from unittest.mock import MagicMock, Mock, patch, AsyncMock
 from datetime import datetime, timedelta
-from src.database import DatabaseManager, PostgreSQLManager, MongoDBManager, QueryResult
+from src.database import (
+    DatabaseManager, PostgreSQLManager, MongoDBManager, QueryResult,
+    SCHEMA_DDL, to_columns
+)
 from src.config import DatabaseConfig
 
 
@@ -904,4 +909,131 @@ class TestMongoDBOperations:
         # Test capped collection creation
         collection_options = {"capped": True, "size": 1000000, "max": 1000}
         mock_db.create_collection("logs", **collection_options)
-        mock_db.create_collection.assert_called_with("logs", capped=True, size=1000000, max=1000) 
\ No newline at end of file
+        mock_db.create_collection.assert_called_with("logs", capped=True, size=1000000, max=1000) 
+
+
+class TestDatabaseManager:
+    """Test combined database manager operations."""
+    
+    @pytest.mark.database
+    def test_initialize_schema_batches_tables(self):
+        """Test schema setup creates all tables in one ordered script."""
+        db_manager = DatabaseManager(DatabaseConfig())
+        db_manager._connected = True
+        db_manager.postgres.execute_command = AsyncMock(return_value=True)
+        db_manager.mongodb.create_indexes = Mock(return_value=True)
+        
+        assert asyncio.run(db_manager.initialize_schema()) is True
+        db_manager.postgres.execute_command.assert_awaited_once_with(SCHEMA_DDL)
+        assert SCHEMA_DDL.index("users (") < SCHEMA_DDL.index("products (") < SCHEMA_DDL.index("orders (")
+        db_manager.mongodb.create_indexes.assert_any_call("users", [("email", True)])
+        assert db_manager.mongodb.create_indexes.call_count == 3
+    
+    @pytest.mark.database
+    def test_execute_many_uses_one_connection(self):
+        """Test batched commands share a connection and transaction."""
+        pg_manager = PostgreSQLManager(DatabaseConfig())
+        mock_conn = MagicMock()
+        mock_conn.execute = AsyncMock(return_value=None)
+        mock_conn.transaction.return_value.__aenter__ = AsyncMock()
+        mock_conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+        pg_manager.pool = MagicMock()
+        pg_manager.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+        pg_manager.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+        
+        commands = [("INSERT INTO users (name) VALUES ($1)", ("a",)), ("DELETE FROM users", ())]
+        assert asyncio.run(pg_manager.execute_many(commands)) is True
+        pg_manager.pool.acquire.assert_called_once()
+        assert mock_conn.execute.await_count == 2
+    
+    @pytest.mark.database
+    def test_insert_documents_batch(self):
+        """Test documents are inserted with a single unordered insert_many."""
+        mongo_manager = MongoDBManager()
+        mongo_manager.database = MagicMock()
+        collection = mongo_manager.database.__getitem__.return_value
+        collection.insert_many.return_value = Mock(inserted_ids=["id1", "id2"])
+        
+        ids = mongo_manager.insert_documents("users", [{"name": "a"}, {"name": "b"}])
+        assert ids == ["id1", "id2"]
+        collection.insert_many.assert_called_once_with(
+            [{"name": "a"}, {"name": "b"}], ordered=False, bypass_document_validation=False
+        )
+    
+    @pytest.mark.database
+    def test_find_documents_stringifies_only_top_level_id(self):
+        """Test the document id becomes a string while nested references stay ObjectIds."""
+        mongo_manager = MongoDBManager()
+        mongo_manager.database = MagicMock()
+        collection = mongo_manager.database.__getitem__.return_value
+        user_id = bson.ObjectId("507f1f77bcf86cd799439012")
+        raw = bson.encode({
+            "_id": bson.ObjectId("507f1f77bcf86cd799439011"),
+            "user_id": user_id,
+            "items": [{"product_id": user_id}]
+        })
+        collection.find.return_value.limit.return_value = iter([bson.decode(raw)])
+        
+        result = mongo_manager.find_documents("orders", limit=10)
+        
+        assert result[0]["_id"] == "507f1f77bcf86cd799439011"
+        assert result[0]["user_id"] == user_id
+        assert isinstance(result[0]["items"][0]["product_id"], bson.ObjectId)
+        collection.find.assert_called_once_with({}, batch_size=10)
+    
+    @pytest.mark.database
+    def test_to_columns_layout(self):
+        """Test query rows convert to a column-oriented layout."""
+        rows = [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]
+        
+        assert to_columns(rows) == {"id": [1, 2], "name": ["John", "Jane"]}
+        assert to_columns([]) == {}
+    
+    @pytest.mark.database
+    def test_pool_keeps_prepared_statements(self):
+        """Test the connection pool is configured with a large statement cache."""
+        pg_manager = PostgreSQLManager(DatabaseConfig())
+        
+        with patch('src.database.asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
+            asyncio.run(pg_manager.connect())
+        
+        kwargs = mock_create_pool.await_args.kwargs
+        assert kwargs["statement_cache_size"] == 1024
+        assert kwargs["max_cached_statement_lifetime"] == 0
+    
+    @pytest.mark.database
+    def test_concurrent_initialize_connects_once(self):
+        """Test racing schema initializations share one connection attempt."""
+        db_manager = DatabaseManager(DatabaseConfig())
+        db_manager.postgres.create_all_tables = AsyncMock(return_value=True)
+        db_manager.mongodb.create_indexes = Mock(return_value=True)
+        
+        async def slow_connect():
+            await asyncio.sleep(0.01)
+            db_manager._connected = True
+        
+        async def run():
+            with patch.object(db_manager, 'connect_all', side_effect=slow_connect) as mock_connect:
+                results = await asyncio.gather(*(db_manager.initialize_schema() for _ in range(3)))
+            return results, mock_connect.await_count
+        
+        results, connect_count = asyncio.run(run())
+        assert results == [True, True, True]
+        assert connect_count == 1
+    
+    @pytest.mark.database
+    def test_mongo_calls_run_on_bounded_pool(self):
+        """Test pymongo calls are offloaded to the manager's own thread pool."""
+        mongo_manager = MongoDBManager(max_workers=2)
+        
+        async def run():
+            return await asyncio.gather(
+                *(mongo_manager.run_async(lambda: threading.current_thread().name) for _ in range(4))
+            )
+        
+        names = asyncio.run(run())
+        assert all(name.startswith("mongodb") for name in names)
+        assert len(set(names)) <= 2
+        
+        mongo_manager.disconnect()
+        assert mongo_manager._executor is None